@@ -11,11 +11,14 @@ Contact at www.sinclair.bio
 __version__ = '1.1.1'
 
 # Built-in modules #
-import sys, argparse, types, inspect, functools, os.path
+import sys, argparse, types, inspect, functools, hashlib, os.path
 
 # Internal modules #
 from optmagic.argument import Argument
 from optmagic.pytest_action import PytestAction
+from optmagic.worker_action import WorkerAction
+from optmagic.work_queue import WorkQueue
+from optmagic.renderer import Renderer
 
 # Third party modules #
 import docstring_parser
@@ -89,14 +92,22 @@ class OptMagic:
 
     @functools.cached_property
     def arguments(self):
-        # Create all Argument objects #
-        result = [Argument(self,
-                           param.name,
+        """
+        Create all Argument objects in a single pass. Each one needs to know
+        which short letters were already picked by the ones before it.
+        """
+        # Initialize #
+        result, taken = [], set()
+        # Iterate over parameters #
+        for param in self.sig.parameters.values():
+            arg = Argument(param.name,
                            param.default,
-                           self.sub_docs[param.name])
-                  for param in self.sig.parameters.values()]
+                           self.sub_docs[param.name],
+                           taken)
+            if arg.short_letter is not None: taken.add(arg.short_letter)
+            result.append(arg)
         # Return #
-        return result
+        return tuple(result)
 
     #----------------------------- Parameters --------------------------------#
     @functools.cached_property
@@ -158,9 +169,6 @@ class OptMagic:
         if url is not None:
             msg = "More information at " + url
             msg = '-'*75 + '\n| ' + msg + '\n' + '-'*75
-            # Remove a new line from the last required argument #
-            last_req = [arg for arg in self.arguments if not arg.has_default]
-            if last_req: last_req[-1].help = last_req[-1].help[:-1]
             # Return #
             return msg
 
@@ -208,8 +216,12 @@ class OptMagic:
             required = parser.add_argument_group('Required arguments')
         else:
             required = None
+        # Remove a new line from the last required argument if needed #
+        last_req = [arg for arg in self.arguments if not arg.has_default]
+        if last_req and self.epilog_string is not None: last = last_req[-1]
+        else:                                           last = None
         # Iterate over arguments and offer up both groups #
-        for arg in self.arguments: arg.add_arg(parser, required)
+        for arg in self.arguments: arg.add_arg(parser, required, arg is last)
         # Add the version action #
         parser.add_argument('--version', '-v', action='version',
                             version=self.version_string,
@@ -222,6 +234,17 @@ class OptMagic:
         parser.add_argument('--pytest', action=PytestAction,
                             help='Run the test suite and exit.',
                             default=self.base_path)
+        # Add the distributed execution options #
+        # They are prefixed so as not to clash with the object's parameters
+        parser.add_argument('--optmagic_enqueue', metavar='DIR',
+                            dest='optmagic_enqueue', default=None,
+                            help='Add this invocation to the work queue in\n'
+                                 'the given directory instead of running it.')
+        parser.add_argument('--optmagic_worker', metavar='DIR',
+                            action=WorkerAction,
+                            optmagic=self,
+                            help='Execute invocations from the work queue in\n'
+                                 'the given directory and exit.')
         # Return #
         return parser
 
@@ -237,28 +260,64 @@ class OptMagic:
 
     @functools.cached_property
     def kwargs(self):
-        return vars(self.parsed_args)
+        kwargs = dict(vars(self.parsed_args))
+        # This one is not destined to the object we are exposing #
+        kwargs.pop('optmagic_enqueue', None)
+        return kwargs
+
+    @functools.cached_property
+    def enqueue_dir(self):
+        """The work queue directory if `--optmagic_enqueue` was specified."""
+        return self.parsed_args.optmagic_enqueue
 
     #------------------------------- Methods ---------------------------------#
     def __call__(self, *extra_args, **extra_kwargs):
+        # Defer the execution to a worker if requested #
+        if self.enqueue_dir is not None:
+            return WorkQueue(self.enqueue_dir).enqueue(self.kwargs)
+        # Otherwise call directly #
+        return self.call(self.kwargs, *extra_args, **extra_kwargs)
+
+    def call(self, kwargs, *extra_args, **extra_kwargs):
+        """
+        Call the exposed object with a given set of keyword arguments instead
+        of the ones coming from the command line. This is used by workers
+        executing records from a `WorkQueue`.
+        """
         # Call if it's a function #
         if self.type == 'function':
-            return self.func(**self.kwargs)
+            return self.func(**kwargs)
         # Call if it's a class #
         if self.type == 'class':
-            instance = self.obj(**self.kwargs)
+            instance = self.obj(**kwargs)
             return instance(*extra_args, **extra_kwargs)
 
     #------------------------------- Extras ----------------------------------#
     @functools.cached_property
-    def markdown(self):
+    def fingerprint(self):
         """
-        #TODO
-        Return a markdown version of the help string.
-        Beware, this actually creates a file somewhere on the filesystem!
+        A hash of everything that ends up in the generated documentation.
+        If it doesn't change, the documentation doesn't need to change either.
         """
-        import argmark
-        return argmark.md_help(self.parser)
+        parts = [__version__, str(self.sig), self.docstring,
+                 self.version_string, self.title_string, self.epilog_string]
+        text  = '\n'.join(part or '' for part in parts)
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    @functools.cached_property
+    def markdown(self):
+        """Return a markdown version of the help string."""
+        return Renderer(self).markdown
+
+    @functools.cached_property
+    def man(self):
+        """Return a man page version of the help string."""
+        return Renderer(self).man
+
+    @functools.cached_property
+    def html(self):
+        """Return an HTML version of the help string."""
+        return Renderer(self).html
 
 ###############################################################################
 # The code below is used for debugging purposes
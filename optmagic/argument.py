@@ -8,22 +8,61 @@ Contact at www.sinclair.bio
 """
 
 # Built-in modules #
-import inspect, functools, re
+import inspect, re
 
 ###############################################################################
 class Argument:
+    """
+    An immutable description of one parameter of the exposed object.
+    Everything is computed once in the constructor and stored in slots.
+    There is no reference back to the parent OptMagic object so that large
+    registries of arguments don't create any reference cycles.
+    """
 
-    def __init__(self, optmagic, name, default, desc):
-        # A reference to the parent object #
-        self.optmagic = optmagic
-        # The python variable name #
-        self.name = name
-        # The default value #
-        self.default = default
-        # The description of this argument in the docstring #
-        self.desc = desc
-        # An attribute to check if a value is cached #
-        self.letter_chosen = False
+    __slots__ = ('name', 'default', 'desc', 'has_default', 'short_letter',
+                 'help', 'choices', 'type', 'metavar')
+
+    def __init__(self, name, default, desc, taken=frozenset()):
+        """
+        Args:
+
+            name: The python variable name.
+
+            default: The default value or `inspect._empty` if there is none.
+
+            desc: The description of this argument in the docstring.
+
+            taken: The short letters already used by the other arguments
+                   so that we avoid picking twice the same one.
+        """
+        # Use the parent method since ours forbids any change #
+        init = object.__setattr__
+        # The basic attributes #
+        init(self, 'name',    name)
+        init(self, 'default', default)
+        init(self, 'desc',    desc)
+        # Did the argument have a default value or not #
+        init(self, 'has_default', default is not inspect._empty)
+        # The derived attributes #
+        init(self, 'short_letter', self.pick_letter(taken))
+        init(self, 'help',         self.desc + '\n\n')
+        init(self, 'choices',      self.guess_choices())
+        init(self, 'type',         None)
+        init(self, 'metavar',      self.guess_metavar())
+
+    def __setattr__(self, key, value):
+        raise AttributeError("Argument objects are immutable.")
+
+    def __delattr__(self, key):
+        raise AttributeError("Argument objects are immutable.")
+
+    def __getstate__(self):
+        """Needed by `pickle` and `copy` since we have no `__dict__`."""
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    def __setstate__(self, state):
+        """Restore the slots without going through our `__setattr__`."""
+        for key, value in state.items(): object.__setattr__(self, key, value)
 
     def __repr__(self):
         """A simple representation of this object to avoid memory addresses."""
@@ -37,7 +76,7 @@ class Argument:
         return msg
 
     #----------------------------- Properties --------------------------------#
-    @functools.cached_property
+    @property
     def flat_desc(self):
         """
         The same string as self.desc but with newlines and whitespaces removed
@@ -45,23 +84,30 @@ class Argument:
         """
         return ' '.join(self.desc.split()).lower()
 
-    @functools.cached_property
-    def has_default(self):
-        """Did the argument have a default value or not?"""
-        return self.default is not inspect._empty
+    @property
+    def kwargs(self):
+        # Initialize #
+        kwargs = {}
+        # Add options #
+        if self.help is not None:    kwargs['help']    = self.help
+        if self.default is not None: kwargs['default'] = self.default
+        if self.choices is not None: kwargs['choices'] = self.choices
+        if self.type is not None:    kwargs['type']    = self.type
+        if self.metavar is not None: kwargs['metavar'] = self.metavar
+        # Is it required #
+        kwargs['required'] = not self.has_default
+        # Return #
+        return kwargs
 
-    @functools.cached_property
-    def short_letter(self):
+    #----------------------------- Parameters --------------------------------#
+    def pick_letter(self, taken):
         """
         Pick a short letter for the option in addition to its full name.
         For this we need to check the short letters of the other arguments
         in order to avoid picking twice the same one.
         """
         # Which letters have been taken already #
-        existing = set(arg.short_letter for arg in self.optmagic.arguments
-                       if arg.letter_chosen is True) | {'h', 'v'}
-        # So that other arguments can check if this attribute is set #
-        self.letter_chosen = True
+        existing = set(taken) | {'h', 'v'}
         # Check if all letters are taken #
         if len(existing) == 26: return None
         # Function to pick possible letters iteratively #
@@ -79,13 +125,7 @@ class Argument:
         for letter in pick_letter():
             if letter not in existing: return letter
 
-    #----------------------------- Parameters --------------------------------#
-    @functools.cached_property
-    def help(self):
-        return self.desc + '\n\n'
-
-    @functools.cached_property
-    def choices(self):
+    def guess_choices(self):
         """
         Example:
         parser.add_argument('throw', choices=['rock', 'paper', 'scissors']).
@@ -106,16 +146,7 @@ class Argument:
         # Return #
         return choices
 
-    @functools.cached_property
-    def type(self):
-        """
-        Example:
-        parser.add_argument('throw',  type=int).
-        """
-        return None
-
-    @functools.cached_property
-    def metavar(self):
+    def guess_metavar(self):
         """
         Example:
         parser.add_argument('throw',  metavar="EXAMPLE").
@@ -126,7 +157,7 @@ class Argument:
         words = self.desc.split()
         # Let's take the second word of the docstring if the first word
         # is "the".
-        if words[0].lower() == "the":
+        if len(words) > 1 and words[0].lower() == "the":
             metavar = words[1].upper()
         # Some names can be abbreviated #
         if metavar == "NUMBER":    metavar = "NUM"
@@ -134,29 +165,21 @@ class Argument:
         # Return #
         return metavar
 
-    @functools.cached_property
-    def kwargs(self):
-        # Initialize #
-        kwargs = {}
-        # Add options #
-        if self.help is not None:    kwargs['help']    = self.help
-        if self.default is not None: kwargs['default'] = self.default
-        if self.choices is not None: kwargs['choices'] = self.choices
-        if self.type is not None:    kwargs['type']    = self.type
-        if self.metavar is not None: kwargs['metavar'] = self.metavar
-        # Is it required #
-        kwargs['required'] = not self.has_default
-        # Return #
-        return kwargs
-
     #------------------------------- Methods ---------------------------------#
-    def add_arg(self, parser, required):
-        """Add this argument to the argparse parser."""
+    def add_arg(self, parser, required, last=False):
+        """
+        Add this argument to the argparse parser. When `last` is set, the
+        trailing blank line of the help is removed since an epilog follows.
+        """
         # We should add it to the default group in most cases #
         if self.has_default: group = parser
         # If we don't have a default value we add it to the required group #
         else: group = required
+        # Remove a new line from the help if needed #
+        kwargs = self.kwargs
+        if last: kwargs['help'] = kwargs['help'][:-1]
+        # The short option is only present if a letter was available #
+        names = ['--' + self.name]
+        if self.short_letter is not None: names.append('-' + self.short_letter)
         # Call method with all arguments #
-        return group.add_argument('--' + self.name,
-                                  '-' + self.short_letter,
-                                  **self.kwargs)
\ No newline at end of file
+        return group.add_argument(*names, **kwargs)
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair.
+MIT Licensed.
+Contact at www.sinclair.bio
+
+Call it like this to regenerate the documentation of a whole package:
+
+    $ python3 -m optmagic.bulk_renderer --package mytools --output_dir docs
+"""
+
+# Built-in modules #
+import os, sys, ast, json, importlib, importlib.util, pkgutil, functools
+from concurrent.futures import ProcessPoolExecutor
+
+# Constants #
+extensions = {'markdown': '.md', 'man': '.1', 'html': '.html'}
+
+###############################################################################
+def find_targets(module_name, source):
+    """
+    Search the source code of a module for calls like `OptMagic(Car)` and
+    return the names of the objects that are exposed in this way.
+    """
+    result = []
+    for node in ast.walk(ast.parse(source)):
+        if not isinstance(node, ast.Call) or not node.args: continue
+        func = node.func
+        name = func.attr if isinstance(func, ast.Attribute) else \
+               getattr(func, 'id', None)
+        if name != 'OptMagic': continue
+        target = ast.unparse(node.args[0]) if hasattr(ast, 'unparse') else \
+                 getattr(node.args[0], 'id', None)
+        if target and (module_name, target) not in result:
+            result.append((module_name, target))
+    return result
+
+def render_target(module_name, target, formats, output_dir, previous):
+    """
+    Render the documentation of one exposed object. This runs inside a
+    worker process. Nothing is written if the fingerprint of the object
+    is the same as the `previous` one and the files are still present.
+    Returns the fingerprint and whether the files were rendered again.
+    """
+    # Import #
+    from optmagic import OptMagic
+    module = importlib.import_module(module_name)
+    # The target could be a local variable for instance #
+    try: obj = functools.reduce(getattr, target.split('.'), module)
+    except AttributeError:
+        msg = "`%s` is not an attribute of the module '%s'."
+        raise LookupError(msg % (target, module_name))
+    magic = OptMagic(obj)
+    # Where the files go #
+    base  = os.path.join(output_dir, module_name + '.' + target)
+    paths = {fmt: base + extensions[fmt] for fmt in formats}
+    # Check if anything changed #
+    if magic.fingerprint == previous:
+        if all(os.path.exists(path) for path in paths.values()):
+            return magic.fingerprint, False
+    # Render everything before writing so that a failure leaves no file #
+    texts = {fmt: getattr(magic, fmt) for fmt in formats}
+    for fmt, path in paths.items():
+        with open(path, 'w') as handle: handle.write(texts[fmt])
+    # Return #
+    return magic.fingerprint, True
+
+###############################################################################
+class BulkRenderer:
+    """
+    Walks every module of a package, finds all the objects that are exposed
+    to the shell with OptMagic and renders their documentation in parallel.
+    Objects whose fingerprint, covering their signature, their docstring and
+    the version strings, did not change since the last run are skipped.
+    Objects that fail to render are reported and listed in the `failed`
+    attribute without stopping the others, and an exception is raised at
+    the end so that the run does not look successful.
+    """
+
+    cache_name = 'optmagic_docs.json'
+
+    def __init__(self,
+                 package,
+                 output_dir = 'docs',
+                 formats    = 'markdown,man,html',
+                 processes  = None,
+                 ):
+        """
+        Args:
+
+            package: The name of the package to walk, as you would import it.
+
+            output_dir: The directory in which all the documents are written.
+                        It is created if it does not exist yet.
+
+            formats: The comma-separated list of formats to produce among
+                     'markdown', 'man' and 'html'.
+
+            processes: The number of worker processes. By default it is the
+                       number of processors on this machine.
+        """
+        # Save attributes #
+        self.package    = package
+        self.output_dir = output_dir
+        self.formats    = formats
+        self.processes  = processes
+        # Convert and validate #
+        self.transform()
+        self.validate()
+        # Will contain the error message of every target that failed #
+        self.failed = {}
+
+    def transform(self):
+        # The formats should be a list #
+        if isinstance(self.formats, str):
+            self.formats = [f.strip() for f in self.formats.split(',')]
+        # The processes should be an integer #
+        if self.processes is not None:
+            self.processes = int(self.processes)
+
+    def validate(self):
+        for fmt in self.formats:
+            if fmt not in extensions:
+                msg = "The format '%s' is not one of %s."
+                raise ValueError(msg % (fmt, ', '.join(extensions)))
+
+    def __repr__(self):
+        return "<%s object on '%s'>" % (self.__class__.__name__, self.package)
+
+    #----------------------------- Properties --------------------------------#
+    @functools.cached_property
+    def cache_path(self):
+        return os.path.join(self.output_dir, self.cache_name)
+
+    @functools.cached_property
+    def modules(self):
+        """The names of all the modules inside the package."""
+        package = importlib.import_module(self.package)
+        result  = [self.package]
+        if hasattr(package, '__path__'):
+            prefix = self.package + '.'
+            result += [info.name for info in
+                       pkgutil.walk_packages(package.__path__, prefix)]
+        return result
+
+    @functools.cached_property
+    def targets(self):
+        """
+        A list of `(module_name, target)` tuples. We only read the source
+        code here, the modules are imported inside the workers.
+        """
+        result = []
+        for name in self.modules:
+            spec = importlib.util.find_spec(name)
+            if spec is None or not spec.origin: continue
+            if not spec.origin.endswith('.py'): continue
+            with open(spec.origin) as handle: source = handle.read()
+            if 'OptMagic' not in source: continue
+            result += find_targets(name, source)
+        return result
+
+    #------------------------------- Methods ---------------------------------#
+    def __call__(self, verbose=False):
+        """
+        Render everything and return the list of targets that were actually
+        rendered again. Raises a RuntimeError if any target failed, once the
+        fingerprints of the other ones have been saved.
+        """
+        # Load the fingerprints of the last run #
+        os.makedirs(self.output_dir, exist_ok=True)
+        if os.path.exists(self.cache_path):
+            with open(self.cache_path) as handle: cache = json.load(handle)
+        else: cache = {}
+        # Submit one job per target #
+        keys = {target: '%s:%s' % target for target in self.targets}
+        with ProcessPoolExecutor(max_workers=self.processes) as pool:
+            futures = {target: pool.submit(render_target, *target,
+                                           self.formats,
+                                           self.output_dir,
+                                           cache.get(keys[target]))
+                       for target in self.targets}
+        # Update the fingerprints #
+        rendered = []
+        for target, future in futures.items():
+            try: fingerprint, changed = future.result()
+            except Exception as error:
+                # Render this one again next time #
+                cache.pop(keys[target], None)
+                msg = "%s: %s" % (error.__class__.__name__, error)
+                self.failed[target] = msg
+                print("Failed `%s`. %s" % (keys[target], msg), file=sys.stderr)
+                continue
+            cache[keys[target]] = fingerprint
+            if changed: rendered.append(target)
+            if verbose:
+                state = 'Rendered' if changed else 'Unchanged'
+                print("%s `%s`." % (state, keys[target]))
+        with open(self.cache_path, 'w') as handle:
+            json.dump(cache, handle, indent=4, sort_keys=True)
+        # Make sure the failures are noticed #
+        if self.failed:
+            names = ', '.join('`%s`' % keys[target] for target in self.failed)
+            msg = "%i target(s) failed to render: %s."
+            raise RuntimeError(msg % (len(self.failed), names))
+        # Return #
+        return rendered
+
+###############################################################################
+if __name__ == '__main__':
+    from optmagic import OptMagic
+    OptMagic(BulkRenderer)()
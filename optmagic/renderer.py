@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair.
+MIT Licensed.
+Contact at www.sinclair.bio
+"""
+
+# Built-in modules #
+import argparse, functools, html
+
+###############################################################################
+class Renderer:
+    """
+    Produces the help of an OptMagic object in several document formats.
+    Everything is generated in memory from the argparse parser, nothing is
+    ever written to the filesystem.
+    """
+
+    def __init__(self, optmagic):
+        # A reference to the parent object #
+        self.optmagic = optmagic
+
+    def __repr__(self):
+        """A simple representation of this object to avoid memory addresses."""
+        return "<%s object on '%s'>" % (self.__class__.__name__, self.optmagic)
+
+    #----------------------------- Properties --------------------------------#
+    @functools.cached_property
+    def parser(self):
+        return self.optmagic.parser
+
+    @functools.cached_property
+    def prog(self):
+        return self.optmagic.prog_string
+
+    @functools.cached_property
+    def usage(self):
+        """The usage summary without the 'usage:' prefix."""
+        usage = self.parser.format_usage().strip()
+        return ' '.join(usage.split()).replace('usage: ', '', 1)
+
+    @functools.cached_property
+    def description(self):
+        return (self.optmagic.title_string or '').strip()
+
+    @functools.cached_property
+    def epilog(self):
+        """The epilog without the frame drawn around it for the terminal."""
+        return (self.optmagic.epilog_string or '').strip('-\n| ')
+
+    @functools.cached_property
+    def defaults(self):
+        """Only the defaults of the exposed object are worth displaying."""
+        return {arg.name: arg.default for arg in self.optmagic.arguments
+                if arg.has_default and arg.default is not None}
+
+    @functools.cached_property
+    def groups(self):
+        """
+        A list of `(title, rows)` tuples mirroring the groups of the help
+        message. Every row is a dictionary describing one option.
+        """
+        result = []
+        for group in self.parser._action_groups:
+            rows = [self.row(action) for action in group._group_actions
+                    if action.help is not argparse.SUPPRESS]
+            if rows: result.append((group.title, rows))
+        return result
+
+    #------------------------------- Methods ---------------------------------#
+    def row(self, action):
+        """Describe one argparse action as a dictionary."""
+        # Options that take no value don't have a metavar #
+        if action.nargs == 0: metavar = None
+        else:                 metavar = action.metavar or action.dest.upper()
+        # The help text on a single line #
+        desc = ' '.join((action.help or '').split())
+        # Return #
+        return dict(names    = action.option_strings,
+                    metavar  = metavar,
+                    default  = self.defaults.get(action.dest),
+                    required = action.required,
+                    desc     = desc)
+
+    #------------------------------- Formats ---------------------------------#
+    @functools.cached_property
+    def markdown(self):
+        """Return a markdown version of the help string."""
+        # Title and usage #
+        lines = ['# `%s`' % self.prog, '', '```', self.usage, '```', '']
+        if self.description: lines += [self.description, '']
+        # One table per group #
+        for title, rows in self.groups:
+            lines += ['## ' + title, '',
+                      '| Option | Default | Description |',
+                      '| ------ | ------- | ----------- |']
+            for row in rows:
+                option = ', '.join('`%s`' % name for name in row['names'])
+                if row['metavar']: option += ' `%s`' % row['metavar']
+                default = '' if row['default'] is None else \
+                          '`%s`' % row['default']
+                desc = row['desc'].replace('|', '\\|')
+                lines.append('| %s | %s | %s |' % (option, default, desc))
+            lines.append('')
+        # Epilog #
+        if self.epilog: lines += [self.epilog, '']
+        # Return #
+        return '\n'.join(lines)
+
+    @functools.cached_property
+    def man(self):
+        """Return a man page version of the help string in roff format."""
+        # Escape characters that have a meaning in roff #
+        def esc(text):
+            text = str(text).replace('\\', '\\e').replace('-', '\\-')
+            return '\\&' + text if text.startswith(('.', "'")) else text
+        # Header #
+        title   = esc(self.prog.upper())
+        version = esc(self.optmagic.version_string)
+        lines = ['.TH "%s" "1" "" "%s"' % (title, version),
+                 '.SH NAME',
+                 esc(self.prog),
+                 '.SH SYNOPSIS',
+                 esc(self.usage)]
+        # Description #
+        if self.description:
+            lines.append('.SH DESCRIPTION')
+            for paragraph in self.description.split('\n\n'):
+                lines += [esc(' '.join(paragraph.split())), '.PP']
+            lines.pop()
+        # One section per group #
+        for title, rows in self.groups:
+            lines.append('.SH "%s"' % title.upper())
+            for row in rows:
+                option = ', '.join('\\fB%s\\fR' % esc(n) for n in row['names'])
+                if row['metavar']: option += ' \\fI%s\\fR' % esc(row['metavar'])
+                desc = row['desc']
+                if row['default'] is not None:
+                    desc += ' Default: %s.' % row['default']
+                lines += ['.TP', option, esc(desc)]
+        # Epilog #
+        if self.epilog: lines += ['.SH "SEE ALSO"', esc(self.epilog)]
+        # Return #
+        return '\n'.join(lines) + '\n'
+
+    @functools.cached_property
+    def html(self):
+        """Return a standalone HTML page version of the help string."""
+        esc = html.escape
+        # Title and usage #
+        parts = ['<!DOCTYPE html>',
+                 '<html>',
+                 '<head><meta charset="utf-8"><title>%s</title></head>'
+                 % esc(self.prog),
+                 '<body>',
+                 '<h1>%s</h1>' % esc(self.prog),
+                 '<pre>%s</pre>' % esc(self.usage)]
+        if self.description:
+            parts.append('<pre>%s</pre>' % esc(self.description))
+        # One table per group #
+        for title, rows in self.groups:
+            parts += ['<h2>%s</h2>' % esc(title),
+                      '<table>',
+                      '<tr><th>Option</th><th>Default</th>'
+                      '<th>Description</th></tr>']
+            for row in rows:
+                option = ', '.join('<code>%s</code>' % esc(n)
+                                   for n in row['names'])
+                if row['metavar']:
+                    option += ' <var>%s</var>' % esc(row['metavar'])
+                default = '' if row['default'] is None else \
+                          '<code>%s</code>' % esc(str(row['default']))
+                parts.append('<tr><td>%s</td><td>%s</td><td>%s</td></tr>'
+                             % (option, default, esc(row['desc'])))
+            parts.append('</table>')
+        # Epilog #
+        if self.epilog: parts.append('<p>%s</p>' % esc(self.epilog))
+        # Return #
+        parts += ['</body>', '</html>']
+        return '\n'.join(parts) + '\n'
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Script to measure the memory used by the `optmagic` module when many
+objects are exposed at the same time, for instance in a registry used to
+generate documentation.
+
+Written by Lucas Sinclair.
+MIT Licensed.
+Contact at www.sinclair.bio
+
+Call it like this:
+
+    $ python3 -m optmagic.tests.benchmark_memory --count 10000
+"""
+
+# Built-in modules #
+import gc, tracemalloc
+
+# Module #
+from optmagic import OptMagic
+
+# Constants #
+template = '''
+def target_%(num)i(%(params)s):
+    """
+    Args:
+
+%(docs)s
+    """
+    return %(num)i
+'''
+
+###############################################################################
+def make_target(num, params=8):
+    """Create a new function that has `params` documented parameters."""
+    names  = ['param_%i_%i' % (num, i) for i in range(params)]
+    params = ', '.join(names[:1] + ['%s=%i' % (n, i)
+                                    for i, n in enumerate(names[1:])])
+    docs   = '\n\n'.join('        %s: The value number %i.' % (n, i)
+                         for i, n in enumerate(names))
+    namespace = {}
+    exec(template % dict(num=num, params=params, docs=docs), namespace)
+    return namespace['target_%i' % num]
+
+def benchmark(count=10000, params=8):
+    """
+    Args:
+
+        count: The number of functions to expose.
+
+        params: The number of parameters that each function has.
+    """
+    # Convert #
+    count, params = int(count), int(params)
+    # The functions themselves are not part of the measurement #
+    targets = [make_target(num, params) for num in range(count)]
+    registry = [OptMagic(target) for target in targets]
+    for magic in registry: magic.sig, magic.sub_docs
+    # Measure only the creation of the arguments #
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    for magic in registry: magic.arguments
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Count the objects that only the cyclic garbage collector can reclaim #
+    del registry, magic
+    garbage = gc.collect()
+    gc.enable()
+    # Report #
+    result = dict(targets          = count,
+                  arguments        = count * params,
+                  bytes_per_target = size // count,
+                  cyclic_garbage   = garbage)
+    for key, value in result.items(): print("%-16s %i" % (key, value))
+    return result
+
+###############################################################################
+if __name__ == '__main__': OptMagic(benchmark)()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Script to test the `Argument` objects of the `optmagic` module.
+
+You can execute these tests with pytest.
+
+Written by Lucas Sinclair.
+MIT Licensed.
+Contact at www.sinclair.bio
+
+Call it like this:
+
+    $ pytest ./test_argument.py
+"""
+
+# Built-in modules #
+import gc, copy, pickle, pytest
+
+# Module #
+from optmagic import OptMagic
+
+# Test class #
+from optmagic.tests.simple_car_class import Car
+from optmagic.tests.benchmark_memory import benchmark
+
+###############################################################################
+def test_eager_values():
+    args = {arg.name: arg for arg in OptMagic(Car).arguments}
+    assert [arg.short_letter for arg in args.values()] == \
+           ['n', 'c', 'a', 'o', 's', 'r', 'i']
+    assert args['sided'].metavar == 'SIDE'
+    assert args['name'].has_default is False
+    assert args['max_speed'].kwargs == {'help': 'Lorem.\n\n', 'default': 60,
+                                        'required': False}
+
+def test_immutable():
+    arg = OptMagic(Car).arguments[0]
+    assert not hasattr(arg, '__dict__')
+    with pytest.raises(AttributeError): arg.name = 'other'
+    with pytest.raises(AttributeError): del arg.help
+
+def test_no_cycles():
+    assert not any(isinstance(ref, OptMagic) for arg in OptMagic(Car).arguments
+                   for ref in gc.get_referents(arg))
+    assert benchmark(count=100)['cyclic_garbage'] == 0
+
+def test_round_trip():
+    for arg in OptMagic(Car).arguments:
+        for clone in (copy.copy(arg), copy.deepcopy(arg),
+                      pickle.loads(pickle.dumps(arg))):
+            assert clone is not arg
+            assert [getattr(clone, key) for key in arg.__slots__] == \
+                   [getattr(arg, key) for key in arg.__slots__]
+            with pytest.raises(AttributeError): clone.name = 'other'
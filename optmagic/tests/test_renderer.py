@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Script to test the documentation rendering of the `optmagic` module.
+
+You can execute these tests with pytest.
+
+Written by Lucas Sinclair.
+MIT Licensed.
+Contact at www.sinclair.bio
+
+Call it like this:
+
+    $ pytest ./test_renderer.py
+"""
+
+# Built-in modules #
+import os
+
+# Third party modules #
+import pytest
+
+# Module #
+from optmagic import OptMagic
+from optmagic.bulk_renderer import BulkRenderer
+
+# Test class #
+from optmagic.tests.simple_car_class import Car
+
+###############################################################################
+def test_formats():
+    magic = OptMagic(Car)
+    # Markdown #
+    assert '| `--name`, `-n` `NAME` |  | Lorem. |' in magic.markdown
+    assert '| `--color`, `-c` `COLOR` | `red` | Lorem. |' in magic.markdown
+    assert '## Required arguments' in magic.markdown
+    # Man page #
+    assert magic.man.startswith('.TH "OPTMAGIC" "1"')
+    assert '\\fB\\-\\-max_speed\\fR' in magic.man
+    assert 'Default: 60.' in magic.man
+    # HTML #
+    assert '<code>--sided</code>' in magic.html
+    assert '<code>right</code>' in magic.html
+    # The epilog is present in every format #
+    url = 'More information at https://github.com/xapple/optmagic'
+    assert url in magic.markdown
+    assert '.SH "SEE ALSO"\n' + url.replace('-', '\\-') in magic.man
+    assert '<p>%s</p>' % url in magic.html
+
+def make_package(tmp_path, monkeypatch, name, source):
+    """Create a throwaway package with a single module called `tools`."""
+    package = tmp_path / name
+    package.mkdir()
+    (package / '__init__.py').write_text('"""My tools."""\n')
+    (package / 'tools.py').write_text(source)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+good_source = ('from optmagic import OptMagic\n'
+               'def good(x):\n'
+               '    """\n    Args:\n\n        x: The value.\n    """\n'
+               'if __name__ == "__main__": OptMagic(good)()\n')
+
+def test_bulk(tmp_path, monkeypatch):
+    make_package(tmp_path, monkeypatch, 'goodtools', good_source)
+    output_dir = str(tmp_path / 'docs')
+    # The first run renders everything #
+    first = BulkRenderer('goodtools', output_dir, processes=2)()
+    assert first == [('goodtools.tools', 'good')]
+    path = os.path.join(output_dir, 'goodtools.tools.good.md')
+    from goodtools.tools import good
+    with open(path) as handle: assert handle.read() == OptMagic(good).markdown
+    # The second run has nothing to do #
+    assert BulkRenderer('goodtools', output_dir, processes=2)() == []
+    # Unless a file disappeared #
+    os.remove(path)
+    second = BulkRenderer('goodtools', output_dir, 'markdown')()
+    assert second == [('goodtools.tools', 'good')]
+
+def test_bulk_failures(tmp_path, monkeypatch):
+    # A package with one good and one undocumented function #
+    make_package(tmp_path, monkeypatch, 'badtools', good_source +
+                 'def bad(x):\n'
+                 '    """Nothing documented."""\n'
+                 'if __name__ == "__main__": OptMagic(bad)()\n'
+                 'for missing in []: OptMagic(missing)\n')
+    output_dir = str(tmp_path / 'docs')
+    # The good one is rendered and the others are reported #
+    renderer = BulkRenderer('badtools', output_dir, processes=1)
+    with pytest.raises(RuntimeError, match='2 target'): renderer()
+    assert set(renderer.failed) == {('badtools.tools', 'bad'),
+                                    ('badtools.tools', 'missing')}
+    assert 'LookupError' in renderer.failed[('badtools.tools', 'missing')]
+    # No empty files are left behind #
+    good_md = os.path.join(output_dir, 'badtools.tools.good.md')
+    mtime   = os.path.getmtime(good_md)
+    assert sorted(os.listdir(output_dir)) == ['badtools.tools.good.1',
+                                              'badtools.tools.good.html',
+                                              'badtools.tools.good.md',
+                                              'optmagic_docs.json']
+    # The good one is not rendered again #
+    renderer = BulkRenderer('badtools', output_dir, processes=1)
+    with pytest.raises(RuntimeError): renderer()
+    assert set(renderer.failed) == {('badtools.tools', 'bad'),
+                                    ('badtools.tools', 'missing')}
+    assert os.path.getmtime(good_md) == mtime
+
+def test_fingerprint_version(monkeypatch):
+    import optmagic
+    before = OptMagic(Car).fingerprint
+    monkeypatch.setattr(optmagic, '__version__', '99.0.0')
+    assert OptMagic(Car).fingerprint != before
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Script to test the distributed execution of the `optmagic` module.
+
+You can execute these tests with pytest.
+
+Written by Lucas Sinclair.
+MIT Licensed.
+Contact at www.sinclair.bio
+
+Call it like this:
+
+    $ pytest ./test_work_queue.py
+"""
+
+# Built-in modules #
+import os, time, pathlib, threading, multiprocessing
+
+# Third party modules #
+import pytest
+
+# Module #
+from optmagic import OptMagic
+from optmagic.work_queue import WorkQueue
+
+###############################################################################
+def square(number, marker_dir=None):
+    """
+    Args:
+
+        number: The number to square.
+
+        marker_dir: A directory in which to leave a trace of every call.
+    """
+    if marker_dir is not None:
+        path = os.path.join(marker_dir, '%s.%i' % (number, os.getpid()))
+        open(path, 'w').close()
+    time.sleep(0.01)
+    return int(number) ** 2
+
+def explode(number):
+    """
+    Args:
+
+        number: Ignored.
+    """
+    raise ValueError("Boom %s." % number)
+
+def run_worker(directory):
+    WorkQueue(directory, poll=0.05).work(OptMagic(square).call)
+
+###############################################################################
+def test_several_workers(tmp_path):
+    # Fill the queue #
+    queue_dir, marker_dir = str(tmp_path / 'queue'), str(tmp_path / 'markers')
+    os.makedirs(marker_dir)
+    queue = WorkQueue(queue_dir)
+    for i in range(40): queue.enqueue({'number': i, 'marker_dir': marker_dir})
+    # Start the workers in separate processes #
+    context = multiprocessing.get_context('fork')
+    workers = [context.Process(target=run_worker, args=(queue_dir,))
+               for _ in range(4)]
+    for worker in workers: worker.start()
+    for worker in workers: worker.join()
+    # Check the result #
+    assert queue.status == {'pending': 0, 'claimed': 0, 'done': 40, 'failed': 0}
+    results = [queue.read(queue.path('done', name))['result']
+               for name in queue.listing('done')]
+    assert results == [i ** 2 for i in range(40)]
+    # Every record was executed exactly once #
+    numbers = sorted(int(name.split('.')[0]) for name in os.listdir(marker_dir))
+    assert numbers == list(range(40))
+
+def test_retry(tmp_path):
+    queue = WorkQueue(str(tmp_path), max_attempts=2, poll=0.05)
+    queue.enqueue({'number': 1})
+    assert queue.work(OptMagic(explode).call) == 0
+    assert queue.status['failed'] == 1
+    record = queue.read(queue.path('failed', queue.listing('failed')[0]))
+    assert record['attempts'] == 2
+    assert 'Boom 1.' in record['error']
+
+def test_lease_expired(tmp_path):
+    # A worker claims a record and then goes silent #
+    dead = WorkQueue(str(tmp_path), lease=0.2)
+    dead.enqueue({'number': 3})
+    claimed, record = dead.claim()
+    time.sleep(0.3)
+    # Another worker recovers it #
+    alive = WorkQueue(str(tmp_path), lease=0.2, poll=0.05)
+    assert alive.work(OptMagic(square).call) == 1
+    # The outcome of the first worker is discarded #
+    assert dead.execute(OptMagic(square).call, claimed, record) is False
+    done = alive.read(alive.path('done', alive.listing('done')[0]))
+    assert done['result'] == 9
+    assert done['attempts'] == 1
+
+def test_enqueue_option(tmp_path):
+    magic = OptMagic(square)
+    magic.optmagic_argv = "--number 4 --optmagic_enqueue %s" % tmp_path
+    ident = magic()
+    record = WorkQueue(str(tmp_path)).read(tmp_path / 'pending' / (ident + '.json'))
+    assert record['kwargs'] == {'number': '4', 'marker_dir': None}
+
+def test_old_pending_record(tmp_path):
+    # A record that waited in the queue for longer than the lease #
+    queue = WorkQueue(str(tmp_path), lease=0.2)
+    ident = queue.enqueue({'number': 2})
+    old = time.time() - 10
+    os.utime(queue.path('pending', ident + '.json'), (old, old))
+    # Claiming it starts a fresh lease that nobody else reaps #
+    claimed, record = queue.claim()
+    assert WorkQueue(str(tmp_path), lease=0.2).reap() == 0
+    assert queue.execute(OptMagic(square).call, claimed, record) is True
+    assert queue.status['done'] == 1
+
+def test_heartbeat_missing_file(tmp_path):
+    # The heartbeat survives a file that is briefly taken by a reaper #
+    queue = WorkQueue(str(tmp_path), lease=0.03)
+    path  = str(tmp_path / 'claimed' / 'record.json')
+    stop  = threading.Event()
+    beat  = threading.Thread(target=queue.heartbeat, args=(path, stop))
+    beat.start()
+    time.sleep(0.05)
+    open(path, 'w').close()
+    os.utime(path, (0, 0))
+    time.sleep(0.05)
+    stop.set()
+    beat.join()
+    assert not queue.expired(path)
+
+def test_enqueue_strict(tmp_path):
+    with pytest.raises(ValueError, match='cannot be stored'):
+        WorkQueue(str(tmp_path)).enqueue({'number': pathlib.Path('/tmp')})
+    assert WorkQueue(str(tmp_path)).status['pending'] == 0
+
+def test_reaper_puts_back(tmp_path):
+    # A reaper holds our claimed file at the moment we finish #
+    queue = WorkQueue(str(tmp_path))
+    queue.enqueue({'number': 5})
+    claimed, record = queue.claim()
+    held = claimed + '.held'
+    os.rename(claimed, held)
+    timer = threading.Timer(0.2, os.rename, (held, claimed))
+    timer.start()
+    # The result is still stored once the file is put back #
+    assert queue.execute(OptMagic(square).call, claimed, record) is True
+    timer.join()
+    assert queue.status['done'] == 1
+
+def test_parameter_named_worker(tmp_path):
+    def tool(number, worker=None, enqueue=None):
+        """
+        Args:
+
+            number: The number.
+
+            worker: A parameter that has the same name as an option.
+
+            enqueue: Another one.
+        """
+        return worker
+    magic = OptMagic(tool)
+    magic.optmagic_argv = "--number 1 --worker a --enqueue b"
+    assert magic() == 'a'
+    assert '--optmagic_worker' in magic.markdown
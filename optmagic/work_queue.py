@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair.
+MIT Licensed.
+Contact at www.sinclair.bio
+"""
+
+# Built-in modules #
+import os, json, time, uuid, socket, threading, traceback
+
+###############################################################################
+class WorkQueue:
+    """
+    A job queue that lives entirely inside a directory. When that directory
+    is placed on a shared filesystem, any number of worker processes running
+    on any number of machines can consume the same queue concurrently.
+
+    The directory contains the following sub-directories:
+
+        pending/  Records waiting to be executed.
+        claimed/  Records currently being executed by a worker.
+        done/     Records that completed, along with their return value.
+        failed/   Records that raised an exception too many times.
+
+    Every state transition is made with `os.rename` which is atomic, so
+    that two workers can never claim the same record. A claimed record
+    carries a lease: the worker keeps touching the file while it runs. If
+    a worker dies, its lease expires and the record is put back in the
+    pending directory by whichever worker notices it first.
+    """
+
+    sub_dirs = ('pending', 'claimed', 'done', 'failed')
+
+    def __init__(self, directory, lease=600, max_attempts=3, poll=1.0):
+        """
+        Args:
+
+            directory: The path to the queue directory. It is created if it
+                       does not exist yet.
+
+            lease: The number of seconds after which a claimed record that
+                   was not refreshed is considered abandoned.
+
+            max_attempts: How many times a record is tried before it is
+                          moved to the failed directory.
+
+            poll: The number of seconds to sleep between two checks when
+                  there is nothing to do.
+        """
+        # Save attributes #
+        self.directory    = os.path.abspath(directory)
+        self.lease        = lease
+        self.max_attempts = max_attempts
+        self.poll         = poll
+        # A unique name for this process, used in the claimed file names #
+        self.token = "%s-%i-%s" % (socket.gethostname(), os.getpid(),
+                                   uuid.uuid4().hex[:8])
+        # Create the directories #
+        for name in self.sub_dirs:
+            os.makedirs(self.path(name), exist_ok=True)
+
+    def __repr__(self):
+        """A simple representation of this object to avoid memory addresses."""
+        return "<%s object on '%s'>" % (self.__class__.__name__, self.directory)
+
+    #------------------------------- Helpers ---------------------------------#
+    def path(self, *parts):
+        return os.path.join(self.directory, *parts)
+
+    def listing(self, name):
+        """The record files in a sub-directory, oldest first."""
+        return sorted(f for f in os.listdir(self.path(name))
+                      if f.endswith('.json') and not f.startswith('.'))
+
+    def write(self, record, *parts):
+        """
+        Write a record by first writing a hidden temporary file and then
+        renaming it, so that readers never see a partially written file.
+        The kwargs are checked in `enqueue`, so only the return values that
+        are not JSON objects end up converted with `repr`.
+        """
+        tmp = self.path(parts[0], '.%s.%s.tmp' % (record['id'], self.token))
+        with open(tmp, 'w') as handle:
+            json.dump(record, handle, default=repr)
+        os.replace(tmp, self.path(*parts))
+
+    def take(self, path, tries=1):
+        """
+        Atomically take ownership of a file by renaming it to a name that
+        only this worker knows. Returns the new path or None if somebody
+        else got to it first. With several `tries`, we wait a bit between
+        each of them, since a reaper checking the lease could be holding
+        the file for a brief moment before putting it back.
+        """
+        tmp = os.path.join(os.path.dirname(path),
+                           '.%s.%s.tmp' % (os.path.basename(path), self.token))
+        for i in range(tries):
+            if i: time.sleep(0.05)
+            try: os.rename(path, tmp)
+            except FileNotFoundError: continue
+            return tmp
+
+    @staticmethod
+    def read(path):
+        with open(path) as handle: return json.load(handle)
+
+    #------------------------------- Producer --------------------------------#
+    def enqueue(self, kwargs):
+        """
+        Add one invocation record to the queue and return its identifier.
+        The identifier starts with a timestamp so that records are roughly
+        executed in the order they were submitted.
+        """
+        # The worker must receive exactly the same values #
+        try: json.dumps(kwargs)
+        except (TypeError, ValueError) as error:
+            msg = "The arguments %r cannot be stored in the work queue as" \
+                  " JSON (%s)." % (kwargs, error)
+            raise ValueError(msg) from error
+        # Write the record #
+        ident  = "%020i-%s" % (time.time_ns(), uuid.uuid4().hex[:8])
+        record = dict(id=ident, kwargs=kwargs, attempts=0)
+        self.write(record, 'pending', ident + '.json')
+        return ident
+
+    @property
+    def status(self):
+        """The number of records in each of the sub-directories."""
+        return {name: len(self.listing(name)) for name in self.sub_dirs}
+
+    #------------------------------- Consumer --------------------------------#
+    def claim(self):
+        """
+        Try to claim the next pending record. Returns the path of the claimed
+        file together with the record, or None if the queue has nothing
+        pending.
+        """
+        for name in self.listing('pending'):
+            ident   = name[:-len('.json')]
+            pending = self.path('pending', name)
+            claimed = self.path('claimed', '%s.%s.json' % (ident, self.token))
+            # The rename preserves the mtime, so start the lease beforehand #
+            # Another worker might have been faster at any of these steps #
+            try:
+                os.utime(pending)
+                os.rename(pending, claimed)
+                return claimed, self.read(claimed)
+            except FileNotFoundError:
+                continue
+
+    def reap(self):
+        """
+        Put back records whose lease has expired because the worker holding
+        them has died or lost access to the shared filesystem.
+        Returns the number of records that were recovered.
+        """
+        count = 0
+        for name in self.listing('claimed'):
+            path = self.path('claimed', name)
+            # Live leases are never renamed away #
+            if not self.expired(path): continue
+            # Make sure no other worker is reaping the same record #
+            tmp = self.take(path)
+            if tmp is None: continue
+            # The owner might have just started the lease in the meantime #
+            if not self.expired(tmp):
+                os.rename(tmp, path)
+                continue
+            record = self.read(tmp)
+            self.retry(record, "Lease expired on '%s'." % name)
+            os.remove(tmp)
+            count += 1
+        return count
+
+    def expired(self, path):
+        """Is the lease of this claimed file over? False if it is gone."""
+        try: age = time.time() - os.path.getmtime(path)
+        except FileNotFoundError: return False
+        return age >= self.lease
+
+    def retry(self, record, error):
+        """Count a failed attempt and send the record to the right place."""
+        record['attempts'] += 1
+        record['error'] = error
+        dest = 'pending' if record['attempts'] < self.max_attempts else 'failed'
+        self.write(record, dest, record['id'] + '.json')
+
+    def heartbeat(self, path, stop):
+        """Refresh the lease of a claimed file until told to stop."""
+        while not stop.wait(self.lease / 3):
+            # A reaper might be checking our file and will put it back #
+            try: os.utime(path)
+            except FileNotFoundError: continue
+
+    def execute(self, func, claimed, record):
+        """
+        Run `func` with the keyword arguments of a claimed record and store
+        the outcome. If our lease was lost in the meantime, the outcome is
+        discarded since another worker now owns the record.
+        """
+        # Keep the lease alive while the function runs #
+        stop = threading.Event()
+        beat = threading.Thread(target=self.heartbeat, args=(claimed, stop),
+                                daemon=True)
+        beat.start()
+        # Call #
+        try:
+            result = func(record['kwargs'])
+            error  = None
+        except Exception:
+            error  = traceback.format_exc()
+        finally:
+            stop.set()
+            beat.join()
+        # Check that we still own the record #
+        tmp = self.take(claimed, tries=20)
+        if tmp is None: return False
+        # Store the outcome #
+        if error is None:
+            record['result'] = result
+            self.write(record, 'done', record['id'] + '.json')
+        else:
+            self.retry(record, error)
+        # Clean up #
+        os.remove(tmp)
+        return error is None
+
+    def work(self, func, forever=False):
+        """
+        Claim and execute records one after the other. By default we return
+        once nothing is pending or claimed anymore. Returns the number of
+        records that were successfully executed by this worker.
+        """
+        count = 0
+        while True:
+            # Recover records from dead workers #
+            self.reap()
+            # Get the next record #
+            claim = self.claim()
+            if claim is not None:
+                count += self.execute(func, *claim)
+                continue
+            # Check if we are finished #
+            if not forever and not self.listing('claimed'): return count
+            # Otherwise wait #
+            time.sleep(self.poll)
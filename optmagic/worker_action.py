@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair.
+MIT Licensed.
+Contact at www.sinclair.bio
+"""
+
+# Built-in modules #
+import argparse
+
+# Internal modules #
+from optmagic.work_queue import WorkQueue
+
+###############################################################################
+class WorkerAction(argparse.Action):
+    """
+    The parent OptMagic object should be passed in with `optmagic`.
+    The queue directory is the value given on the command line.
+    """
+
+    def __init__(self, option_strings, dest, optmagic=None, **kwargs):
+        # Call the parent class constructor #
+        super().__init__(option_strings, dest, **kwargs)
+        # Keep a reference to the object we are exposing #
+        self.optmagic = optmagic
+        # No destination #
+        self.dest = argparse.SUPPRESS
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        # Consume the queue until it is empty #
+        queue = WorkQueue(values)
+        queue.work(self.optmagic.call)
+        # Exit cleanly #
+        parser.exit(status=0)